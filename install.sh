@@ -116,6 +116,8 @@ PYTHON_PACKAGES=(
     "pillow"
     "flask"
     "RPi.GPIO"
+    "waitress"
+    "orjson"
 )
 
 for package in "${PYTHON_PACKAGES[@]}"; do
@@ -4,6 +4,7 @@ Simple script to read AHT10 temperature and humidity sensor on I2C bus 3
 """
 import time
 import logging
+import traceback
 
 try:
     import smbus2
@@ -19,43 +20,49 @@ logger = logging.getLogger(__name__)
 AHT10_ADDRESS = 0x38
 I2C_BUS = 3
 
+# Trigger control byte: 0xFF converts faster, set False to use the classic 0x33
+FAST_TRIGGER = True
+CONVERSION_WAIT = 0.02     # Initial wait after trigger (seconds)
+BUSY_POLL_INTERVAL = 0.01  # Status poll interval while busy (seconds)
+BUSY_POLL_LIMIT = 10       # Max busy polls before using the last read
+
+# 20-bit raw value scale factors
+H_SCALE = 100.0 / (1 << 20)
+T_SCALE = 200.0 / (1 << 20)
+
+# Pre-built I2C messages, reused for every read
+TRIGGER_MSG = smbus2.i2c_msg.write(AHT10_ADDRESS, [0xAC, 0xFF if FAST_TRIGGER else 0x33, 0x00])
+READ_MSG = smbus2.i2c_msg.read(AHT10_ADDRESS, 6)
+
 def read_sensor(bus):
     """Read temperature and humidity from AHT10"""
     try:
         # Trigger measurement using i2c_msg
         logger.info("Triggering measurement...")
-        trigger_msg = smbus2.i2c_msg.write(AHT10_ADDRESS, [0xAC, 0x33, 0x00])
-        bus.i2c_rdwr(trigger_msg)
-        time.sleep(0.1)
+        bus.i2c_rdwr(TRIGGER_MSG)
+        time.sleep(CONVERSION_WAIT)
         
-        # Read 6 bytes
-        read_msg = smbus2.i2c_msg.read(AHT10_ADDRESS, 6)
-        bus.i2c_rdwr(read_msg)
-        data = list(read_msg)
+        # Byte 0 is the status byte, so poll with the full 6-byte read
+        for _ in range(BUSY_POLL_LIMIT):
+            bus.i2c_rdwr(READ_MSG)
+            data = bytes(READ_MSG)
+            if not data[0] & 0x80:
+                break
+            time.sleep(BUSY_POLL_INTERVAL)
+        else:
+            logger.warning("Sensor still busy after polling, using last read")
         
         logger.info(f"Raw data: {' '.join([f'0x{b:02x}' for b in data])}")
         
-        # Check if busy
-        if data[0] & 0x80:
-            logger.warning("Sensor busy, waiting...")
-            time.sleep(0.1)
-            read_msg = smbus2.i2c_msg.read(AHT10_ADDRESS, 6)
-            bus.i2c_rdwr(read_msg)
-            data = list(read_msg)
-        
-        # Extract humidity (20 bits)
-        humidity_raw = ((data[1] << 16) | (data[2] << 8) | data[3]) >> 4
-        humidity = (humidity_raw / 1048576.0) * 100.0
-        
-        # Extract temperature (20 bits)
-        temperature_raw = ((data[3] & 0x0F) << 16) | (data[4] << 8) | data[5]
-        temperature = (temperature_raw / 1048576.0) * 200.0 - 50.0
+        # Bytes 1-5 hold humidity (upper 20 bits) and temperature (lower 20 bits)
+        raw = int.from_bytes(data[1:6], 'big')
+        humidity = (raw >> 20) * H_SCALE
+        temperature = (raw & 0xFFFFF) * T_SCALE - 50.0
         
         return temperature, humidity
     
     except Exception as e:
         logger.error(f"Failed to read sensor: {e}")
-        import traceback
         traceback.print_exc()
         return None, None
 
@@ -82,7 +89,6 @@ def main():
         
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
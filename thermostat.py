@@ -10,14 +10,24 @@ import os
 import sys
 import time
 import logging
+import logging.handlers
 import json
 import signal
+import atexit
 import threading
+import queue
 import socket
-import subprocess
+import http.client
+import errno
+import fcntl
+import mmap
+import struct
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from array import array
 from collections import deque
+from itertools import islice, takewhile
 from threading import Lock
 
 try:
@@ -27,33 +37,74 @@ try:
     from luma.oled.device import ssd1306
     from luma.core.render import canvas
     from PIL import ImageFont, Image, ImageDraw
-    from flask import Flask, render_template, jsonify, request
 except ImportError as e:
     print(f"Error: Required library not installed: {e}")
     sys.exit(1)
 
+# Optional: lgpio keeps one gpiochip handle open (faster relay toggles)
+try:
+    import lgpio
+except ImportError:
+    lgpio = None
+
+# Optional: orjson for faster event log (de)serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: fastrlock is much cheaper than threading.RLock when uncontended.
+# Both are reentrant, so code behaves the same with or without it
+try:
+    from fastrlock.rlock import FastRLock
+except ImportError:
+    FastRLock = threading.RLock
+
 # ============================================================================
 # Configuration
 # ============================================================================
 
 CONFIG_FILE = os.path.expanduser("~/pi-thermo/config.json")
+CONFIG_SAVE_DEBOUNCE = 2.0  # Seconds to coalesce config changes before saving
+CONFIG_SAVE_MAX_BACKOFF = 300.0  # Longest wait between retries of a failed save
 LOG_FILE = os.path.expanduser("~/pi-thermo/thermo.log")
+TEMPLATE_FOLDER = os.path.expanduser("~/pi-thermo/templates")
 EVENT_LOG_FILE = os.path.expanduser("~/pi-thermo/events.log")
+EVENT_LOG_BACKUP_FILE = EVENT_LOG_FILE + ".1"
+EVENT_LOG_MAX_BYTES = 1024 * 1024  # Rotate events.log to events.log.1 past 1 MB
+EVENT_LINE_BYTES = 200  # Generous upper bound on one events.log line
+EVENT_LOG_FSYNC_EVERY = 10  # fsync events.log after this many appends
 
 # Sensor configuration
 AHT10_ADDRESS = 0x38
 AHT10_I2C_BUS = 3
+AHT10_CONVERSION_WAIT = 0.02     # Initial wait after trigger (seconds)
+AHT10_BUSY_POLL_INTERVAL = 0.01  # Status poll interval while busy (seconds)
+AHT10_BUSY_POLL_LIMIT = 10       # Max busy polls before using the last read
+
+# AHT10 20-bit raw value scale factors (temperature folded straight to °F)
+_H_SCALE = 100.0 / (1 << 20)
+_T_SCALE = 200.0 / (1 << 20)
+_TF_SCALE = _T_SCALE * 1.8
+_TF_OFFSET = -50.0 * 1.8 + 32.0
 
 # Display configuration
 OLED_I2C_BUS = 1
 OLED_I2C_ADDR = 0x3c
+OLED_REPAINT_INTERVAL = 60.0  # Push an unchanged frame at least this often (seconds)
 
 # Relay configuration (GPIO pin 13, BCM mode)
 RELAY_PIN = 13
+RELAY_GPIO_CHIP = 0  # gpiochip used by the lgpio backend
 
 # Web server configuration
 WEB_PORT = 5002
 WEB_HOST = "0.0.0.0"
+WEB_SERVER_THREADS = 4  # Request worker threads
+WEB_CONNECTION_LIMIT = 64  # Open connections before waitress stops accepting
+WEB_LISTEN_BACKLOG = 64  # Pending connections the kernel queues for accept()
+WEB_CHANNEL_TIMEOUT = 30  # Close idle client connections after this many seconds
+WEB_MAX_REQUEST_BODY = 64 * 1024  # Largest request body accepted (bytes)
 
 # Default configuration (optimized for Pi Zero 2W with energy saving)
 DEFAULT_CONFIG = {
@@ -68,6 +119,7 @@ DEFAULT_CONFIG = {
     "display_update_interval": 2.0, # Update display every N seconds (slower for Pi Zero 2W)
     "relay_min_on_time": 2.0,      # Minimum relay ON duration (seconds)
     "relay_min_off_time": 2.0,     # Minimum relay OFF duration (seconds)
+    "aht10_fast_trigger": True,    # Use 0xFF trigger control byte (False = classic 0x33)
     "outside_temp_check_interval": 900,  # Check outside temp every 15 minutes
     "thermal_analysis_enabled": True,     # Enable thermal analysis
     "energy_saving_min_temp": 60.0,       # Minimum temp during energy saving
@@ -79,22 +131,82 @@ DEFAULT_CONFIG = {
 # Logging Setup
 # ============================================================================
 
+# Records are formatted on the calling thread and handed to a queue; a
+# listener thread does the file and console writes, so a slow SD card never
+# stalls the control loop or a web request
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler(LOG_FILE),
+    logging.StreamHandler(sys.stdout)
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
+# Cached local IP address (the OLED shows it on every frame)
+IP_CACHE_TTL = 60.0
+SIOCGIFADDR = 0x8915
+_ip_cache = {"ip": None, "ts": 0.0}
+_ip_lock = Lock()
+
+# Shared I2C bus handles and per-bus locks, so two devices on the same bus
+# use one handle and never interleave transactions
+_BUSES = {}
+_BUS_LOCKS = {}
+_BUSES_LOCK = Lock()
+
+def get_bus_lock(bus_num):
+    """Get the lock serializing transactions on an I2C bus"""
+    with _BUSES_LOCK:
+        lock = _BUS_LOCKS.get(bus_num)
+        if lock is None:
+            lock = _BUS_LOCKS[bus_num] = Lock()
+        return lock
+
+def get_bus(bus_num):
+    """Get the shared (bus, lock) pair for an I2C bus, opening it lazily"""
+    lock = get_bus_lock(bus_num)
+    with _BUSES_LOCK:
+        bus = _BUSES.get(bus_num)
+        if bus is None:
+            bus = _BUSES[bus_num] = smbus2.SMBus(bus_num)
+        return bus, lock
+
+def close_bus(bus_num):
+    """Close a shared I2C bus handle"""
+    with _BUSES_LOCK:
+        bus = _BUSES.pop(bus_num, None)
+    if bus is not None:
+        with get_bus_lock(bus_num):
+            bus.close()
+
+def _write_all(fd, data):
+    """Write all of data to fd; os.write() may write only part of it"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
 def get_ip_address():
-    """Get the local IP address - avoid loopback and return actual network IP"""
+    """Get the local IP address, cached for IP_CACHE_TTL seconds"""
+    with _ip_lock:
+        now = time.monotonic()
+        if _ip_cache["ip"] is None or now - _ip_cache["ts"] >= IP_CACHE_TTL:
+            _ip_cache["ip"] = _lookup_ip_address()
+            _ip_cache["ts"] = now
+        return _ip_cache["ip"]
+
+def _lookup_ip_address():
+    """Look up the local IP address - avoid loopback and return actual network IP"""
     try:
         # Try multiple methods to get actual network IP (not loopback)
         
@@ -109,20 +221,23 @@ def get_ip_address():
                 return ip
         except:
             pass
-        s.close()
         
-        # Method 2: Try common network interface addresses
-        possible_ips = ['192.168.1.100', '192.168.0.100', '10.0.0.100', '172.16.0.100']
-        for test_ip in possible_ips:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.settimeout(1)
-            try:
-                s.bind((test_ip, 0))
-                s.close()
-                return test_ip
-            except:
-                s.close()
-                continue
+        # Method 2: Ask the kernel for each interface's IPv4 address (no network I/O)
+        try:
+            for _, ifname in socket.if_nameindex():
+                if ifname == 'lo':
+                    continue
+                try:
+                    ifreq = fcntl.ioctl(s.fileno(), SIOCGIFADDR, struct.pack('256s', ifname[:15].encode()))
+                except OSError:
+                    continue  # Interface has no IPv4 address
+                ip = socket.inet_ntoa(ifreq[20:24])
+                if not ip.startswith('127.') and not ip.startswith('0.'):
+                    s.close()
+                    return ip
+        except Exception:
+            pass
+        s.close()
         
         # Method 3: Fallback to hostname method with validation
         hostname = socket.gethostname()
@@ -140,19 +255,55 @@ def get_ip_address():
         logger.error(f"Error getting IP address: {e}")
         return "192.168.1.100"
 
-def get_outside_temperature():
-    """Get outside temperature from wttr.in API"""
-    try:
-        # Use curl to fetch temperature for zipcode 18960
-        result = subprocess.run(
-            ['curl', '-s', 'https://wttr.in/18960?format=%t&u'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+# Outside temperature (wttr.in), fetched over one kept-alive HTTPS connection
+OUTSIDE_TEMP_HOST = "wttr.in"
+OUTSIDE_TEMP_PATH = "/18960?format=%t&u"  # Zipcode 18960, °F
+OUTSIDE_TEMP_TIMEOUT = 10
+OUTSIDE_TEMP_RETRY_INTERVAL = 60  # Retry sooner than the check interval until the first reading
+_outside_cache = {"temp": None, "ts": 0.0}
+_outside_lock = Lock()
+_outside_conn = None
+
+def _fetch_outside_temperature():
+    """GET the wttr.in temperature string, reusing the open connection"""
+    global _outside_conn
+    for attempt in range(2):
+        if _outside_conn is None:
+            _outside_conn = http.client.HTTPSConnection(OUTSIDE_TEMP_HOST, timeout=OUTSIDE_TEMP_TIMEOUT)
+        try:
+            # wttr.in answers plain text to curl-like user agents
+            _outside_conn.request("GET", OUTSIDE_TEMP_PATH, headers={"User-Agent": "curl/pi-thermo"})
+            response = _outside_conn.getresponse()
+            body = response.read()  # Drain fully so the connection can be reused
+            if response.status != 200:
+                raise OSError(f"HTTP {response.status}")
+            return body.decode("utf-8", "replace").strip()
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            # Server closed the idle keep-alive connection; reconnect once
+            _outside_conn.close()
+            _outside_conn = None
+            if attempt:
+                raise
+        except Exception:
+            _outside_conn.close()
+            _outside_conn = None
+            raise
+
+def get_outside_temperature(max_age=0):
+    """Get outside temperature from wttr.in API
+    
+    Returns (temp_f, fresh). fresh is True when temp_f comes from a fetch no
+    older than max_age seconds (made now or cached). If the fetch fails,
+    temp_f is the last known value (None before the first success) and fresh
+    is False, so callers can show it without mistaking it for a new reading.
+    """
+    with _outside_lock:
+        now = time.monotonic()
+        if _outside_cache["temp"] is not None and now - _outside_cache["ts"] < max_age:
+            return _outside_cache["temp"], True
         
-        if result.returncode == 0:
-            temp_str = result.stdout.strip()
+        try:
+            temp_str = _fetch_outside_temperature()
             # Parse format like "+45°F" or "32°F"
             if '°F' in temp_str:
                 temp_str = temp_str.replace('°F', '').strip()
@@ -161,47 +312,86 @@ def get_outside_temperature():
                     temp_str = temp_str[1:]
                 try:
                     temp_f = float(temp_str)
-                    logger.info(f"Outside temperature: {temp_f}°F")
-                    return temp_f
+                    logger.debug("Outside temperature: %s°F", temp_f)
+                    _outside_cache["temp"] = temp_f
+                    _outside_cache["ts"] = now
+                    return temp_f, True
                 except ValueError:
                     logger.error(f"Could not parse temperature: {temp_str}")
-        else:
-            logger.error(f"curl failed with return code: {result.returncode}")
-            
-    except subprocess.TimeoutExpired:
-        logger.error("Timeout fetching outside temperature")
-    except Exception as e:
-        logger.error(f"Error fetching outside temperature: {e}")
-    
-    return None
+            else:
+                logger.error(f"Unexpected outside temperature response: {temp_str[:40]!r}")
+                
+        except socket.timeout:
+            logger.error("Timeout fetching outside temperature")
+        except Exception as e:
+            logger.error(f"Error fetching outside temperature: {e}")
+        
+        return _outside_cache["temp"], False
 
 # ============================================================================
 # Event Logger
 # ============================================================================
 
+def _encode_event(event):
+    """Encode an event as one events.log line (bytes)"""
+    if orjson is not None:
+        return orjson.dumps(event) + b"\n"
+    return (json.dumps(event) + "\n").encode()
+
+def _decode_event(line):
+    """Decode one events.log line"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
 class EventLogger:
     """Track heating on/off events"""
     
     def __init__(self, max_events=500):
         self.events = deque(maxlen=max_events)
-        self.lock = Lock()
+        self.lock = FastRLock()
         self.load_events()
+        
+        # File appends happen on a writer thread so SD card latency never
+        # stalls the control loop
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
     
     def load_events(self):
-        """Load recent events from file"""
-        if os.path.exists(EVENT_LOG_FILE):
+        """Load recent events from the tail of the log (and its rotated backup)"""
+        maxlen = self.events.maxlen
+        lines = []
+        # Newest events live in the current file; only reach back into the
+        # backup when the current file alone can't fill the deque
+        for path in (EVENT_LOG_FILE, EVENT_LOG_BACKUP_FILE):
+            if os.path.exists(path):
+                try:
+                    lines = self._read_tail(path, maxlen - len(lines)) + lines
+                except Exception as e:
+                    logger.error(f"Error loading events from {path}: {e}")
+            if len(lines) >= maxlen:
+                break
+        
+        for line in lines:
             try:
-                with open(EVENT_LOG_FILE, 'r') as f:
-                    lines = f.readlines()
-                    for line in lines[-500:]:  # Load last 500 events
-                        try:
-                            event = json.loads(line.strip())
-                            self.events.append(event)
-                        except:
-                            pass
-                logger.info(f"Loaded {len(self.events)} events from {EVENT_LOG_FILE}")
-            except Exception as e:
-                logger.error(f"Error loading events: {e}")
+                self.events.append(_decode_event(line))
+            except:
+                pass
+        logger.info(f"Loaded {len(self.events)} events from {EVENT_LOG_FILE}")
+    
+    def _read_tail(self, path, count):
+        """Return the last count lines of one log file as bytes"""
+        with open(path, 'rb') as f:
+            # Only the tail is kept, so read it in one block from near the end
+            tail_start = os.fstat(f.fileno()).st_size - EVENT_LINE_BYTES * count
+            if tail_start > 0:
+                f.seek(tail_start)
+            lines = f.read().split(b"\n")
+        if tail_start > 0:
+            lines = lines[1:]  # Discard the partial first line
+        return [line for line in lines[-count - 1:] if line][-count:]
     
     def log_event(self, event_type, temp_f, humidity):
         """Log a heating event (on/off)"""
@@ -209,156 +399,257 @@ class EventLogger:
             "timestamp": datetime.now().isoformat(),
             "type": event_type,  # "on" or "off"
             "temperature_f": round(temp_f, 1),
-            "humidity": round(humidity, 1) if humidity else None
+            "humidity": round(humidity, 1) if humidity is not None else None
         }
         
         with self.lock:
             self.events.append(event)
         
-        # Write to file
-        try:
-            with open(EVENT_LOG_FILE, 'a') as f:
-                f.write(json.dumps(event) + '\n')
-        except Exception as e:
-            logger.error(f"Error writing event: {e}")
+        # Hand off to the writer thread
+        self._queue.put(event)
+    
+    def _write_loop(self):
+        """Append queued events to the event log file (runs on writer thread)"""
+        # One O_APPEND descriptor for the process lifetime. Everything queued
+        # when the writer wakes is appended in one write() (more only if the
+        # kernel takes part of it), so a burst of events costs one syscall. fsync is batched every
+        # EVENT_LOG_FSYNC_EVERY events and done on shutdown.
+        fd = None
+        size = 0
+        unsynced = 0
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stopping = True
+                batch = batch[:batch.index(None)]
+            if not batch:
+                continue
+            try:
+                if fd is None:
+                    fd = os.open(EVENT_LOG_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                    size = os.fstat(fd).st_size
+                data = b"".join(_encode_event(event) for event in batch)
+                _write_all(fd, data)  # A short write would tear the last line
+                size += len(data)
+                unsynced += len(batch)
+                
+                # Rotate so the log can't grow without bound
+                if size >= EVENT_LOG_MAX_BYTES:
+                    os.fsync(fd)
+                    os.close(fd)
+                    fd = None
+                    unsynced = 0
+                    os.replace(EVENT_LOG_FILE, EVENT_LOG_BACKUP_FILE)
+                    logger.info(f"Rotated event log to {EVENT_LOG_BACKUP_FILE}")
+                elif unsynced >= EVENT_LOG_FSYNC_EVERY:
+                    os.fsync(fd)
+                    unsynced = 0
+            except Exception as e:
+                logger.error(f"Error writing events: {e}")
+        
+        if fd is not None:
+            try:
+                os.fsync(fd)
+                os.close(fd)
+            except Exception as e:
+                logger.error(f"Error closing event log: {e}")
+    
+    def close(self):
+        """Flush pending events and stop the writer thread"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=2.0)
     
     def get_events(self, limit=100):
-        """Get most recent events"""
+        """Get most recent events, newest first"""
+        with self.lock:
+            return list(islice(reversed(self.events), max(limit, 0)))
+    
+    def get_events_since(self, since, limit=100):
+        """Get events newer than the ISO timestamp since, newest first"""
         with self.lock:
-            return list(reversed(list(self.events)[-limit:]))
+            return list(islice(
+                takewhile(lambda event: event["timestamp"] > since, reversed(self.events)),
+                max(limit, 0)
+            ))
 
 # ============================================================================
 # Thermal Analysis
 # ============================================================================
 
 class ThermalAnalysis:
-    """Track and analyze heating/cooling rates"""
+    """Track and analyze heating/cooling rates
+    
+    Rates are derived incrementally: a heating on/off transition opens an
+    edge, and each later sample is checked against that edge only until a
+    rate is found or the edge's sample window runs out.
+    """
+    
+    HEATING_WINDOW = 10  # Samples after an off->on edge to look for a rise
+    COOLING_WINDOW = 15  # Samples after an on->off edge to look for a fall
     
     def __init__(self, max_samples=50):
         self.max_samples = max_samples
-        self.temperature_data = deque(maxlen=max_samples)
+        # Sample history as a fixed-size ring of parallel columns (monotonic
+        # time, °F, heating on) rather than one tuple object per reading
+        self._ts = array('d', bytes(8 * max_samples))
+        self._tf = array('f', bytes(4 * max_samples))
+        self._on = bytearray(max_samples)
+        self._head = 0  # Next slot to write
+        self._count = 0
         self.heating_rates = deque(maxlen=20)
         self.cooling_rates = deque(maxlen=20)
-        self.lock = Lock()
+        self.lock = FastRLock()
+        
+        # Open edges: [timestamp, temp_f, samples_seen] or None
+        self._heat_edge = None
+        self._cool_edge = None
         
         # Current rates
         self.heating_rate_seconds_per_degree = None
         self.cooling_rate_seconds_per_degree = None
+        
+        # get_thermal_data() result, rebuilt on the next call after a reading
+        self._thermal_data = None
     
     def add_temperature_reading(self, temp_f, heating_on):
         """Add temperature reading with heating state"""
-        now = time.time()
-        reading = {
-            "timestamp": now,
-            "temperature_f": temp_f,
-            "heating_on": heating_on
-        }
+        now = time.monotonic()
         
         with self.lock:
-            self.temperature_data.append(reading)
+            head = self._head
+            
+            # Open an edge when heating turns on or off
+            if self._count and self._on[head - 1] != heating_on:
+                if heating_on:
+                    self._heat_edge = [now, temp_f, 0]
+                else:
+                    self._cool_edge = [now, temp_f, 0]
             
-            # Calculate rates if we have enough data
-            if len(self.temperature_data) >= 3:
-                self._calculate_rates()
-    
-    def _calculate_rates(self):
-        """Calculate heating and cooling rates from data"""
-        data = list(self.temperature_data)
-        
-        # Heating rates (when heating turns on and temperature rises)
-        for i in range(1, len(data)):
-            if not data[i-1]["heating_on"] and data[i]["heating_on"]:
-                # Heating just turned on - look for temperature rise
-                for j in range(i, min(i+10, len(data))):
-                    if data[j]["temperature_f"] and data[i]["temperature_f"]:
-                        temp_change = data[j]["temperature_f"] - data[i]["temperature_f"]
-                        time_change = data[j]["timestamp"] - data[i]["timestamp"]
-                        
-                        if temp_change > 0.5 and time_change > 60:  # At least 0.5°F change over 1 minute
-                            rate = time_change / temp_change  # seconds per degree
-                            if 300 < rate < 3600:  # Reasonable range: 5 min to 1 hour per degree
-                                self.heating_rates.append(rate)
-                                break
-        
-        # Cooling rates (when heating turns off and temperature falls)
-        for i in range(1, len(data)):
-            if data[i-1]["heating_on"] and not data[i]["heating_on"]:
-                # Heating just turned off - look for temperature fall
-                for j in range(i, min(i+15, len(data))):
-                    if data[j]["temperature_f"] and data[i]["temperature_f"]:
-                        temp_change = data[i]["temperature_f"] - data[j]["temperature_f"]
-                        time_change = data[j]["timestamp"] - data[i]["timestamp"]
-                        
-                        if temp_change > 0.5 and time_change > 120:  # At least 0.5°F change over 2 minutes
-                            rate = time_change / temp_change  # seconds per degree
-                            if 600 < rate < 7200:  # Reasonable range: 10 min to 2 hours per degree
-                                self.cooling_rates.append(rate)
-                                break
-        
-        # Update current averages
-        if len(self.heating_rates) >= 3:
-            self.heating_rate_seconds_per_degree = sum(self.heating_rates) / len(self.heating_rates)
-        
-        if len(self.cooling_rates) >= 3:
-            self.cooling_rate_seconds_per_degree = sum(self.cooling_rates) / len(self.cooling_rates)
+            self._ts[head] = now
+            self._tf[head] = temp_f
+            self._on[head] = heating_on
+            self._head = (head + 1) % self.max_samples
+            if self._count < self.max_samples:
+                self._count += 1
+            
+            if self._heat_edge:
+                self._heat_edge = self._check_heat_edge(now, temp_f)
+            if self._cool_edge:
+                self._cool_edge = self._check_cool_edge(now, temp_f)
+            
+            self._thermal_data = None
+    
+    def _check_heat_edge(self, now, temp_f):
+        """Look for a heating rate from the open off->on edge, returns the edge or None once closed"""
+        edge = self._heat_edge
+        temp_change = temp_f - edge[1]
+        time_change = now - edge[0]
+        
+        if temp_change > 0.5 and time_change > 60:  # At least 0.5°F change over 1 minute
+            rate = time_change / temp_change  # seconds per degree
+            if 300 < rate < 3600:  # Reasonable range: 5 min to 1 hour per degree
+                self.heating_rates.append(rate)
+                if len(self.heating_rates) >= 3:
+                    self.heating_rate_seconds_per_degree = sum(self.heating_rates) / len(self.heating_rates)
+                return None
+        
+        edge[2] += 1
+        return edge if edge[2] < self.HEATING_WINDOW else None
+    
+    def _check_cool_edge(self, now, temp_f):
+        """Look for a cooling rate from the open on->off edge, returns the edge or None once closed"""
+        edge = self._cool_edge
+        temp_change = edge[1] - temp_f
+        time_change = now - edge[0]
+        
+        if temp_change > 0.5 and time_change > 120:  # At least 0.5°F change over 2 minutes
+            rate = time_change / temp_change  # seconds per degree
+            if 600 < rate < 7200:  # Reasonable range: 10 min to 2 hours per degree
+                self.cooling_rates.append(rate)
+                if len(self.cooling_rates) >= 3:
+                    self.cooling_rate_seconds_per_degree = sum(self.cooling_rates) / len(self.cooling_rates)
+                return None
+        
+        edge[2] += 1
+        return edge if edge[2] < self.COOLING_WINDOW else None
     
     def get_thermal_data(self):
-        """Get current thermal analysis data"""
+        """Get current thermal analysis data
+        
+        The dict is shared between callers until the next reading, so treat
+        it as read-only.
+        """
+        data = self._thermal_data
+        if data is not None:
+            return data
         with self.lock:
-            return {
-                "heating_rate_seconds_per_degree": self.heating_rate_seconds_per_degree,
-                "cooling_rate_seconds_per_degree": self.cooling_rate_seconds_per_degree,
-                "heating_samples": len(self.heating_rates),
-                "cooling_samples": len(self.cooling_rates),
-                "total_samples": len(self.temperature_data)
-            }
+            if self._thermal_data is None:
+                self._thermal_data = {
+                    "heating_rate_seconds_per_degree": self.heating_rate_seconds_per_degree,
+                    "cooling_rate_seconds_per_degree": self.cooling_rate_seconds_per_degree,
+                    "heating_samples": len(self.heating_rates),
+                    "cooling_samples": len(self.cooling_rates),
+                    "total_samples": self._count
+                }
+            return self._thermal_data
 
 # ============================================================================
 # PID Controller
 # ============================================================================
 
 class PIDController:
-    """Simple PID controller for temperature control"""
+    """Simple PID controller for temperature control
     
-    def __init__(self, kp, ki, kd, min_output=0.0, max_output=1.0):
+    Integrates at a fixed step (the sensor read interval) rather than the
+    measured wall time between calls, so a stalled sensor cannot cause an
+    integral kick. Call update() exactly once per fresh sample.
+    """
+    
+    def __init__(self, kp, ki, kd, min_output=0.0, max_output=1.0, fixed_dt=5.0, integral_deadband=0.2):
         self.kp = kp
         self.ki = ki
         self.kd = kd
         self.min_output = min_output
         self.max_output = max_output
+        self.fixed_dt = fixed_dt
+        self.integral_deadband = integral_deadband  # Errors below this (°F) don't accumulate
         
         self.integral = 0.0
         self.last_error = 0.0
-        self.last_time = time.time()
     
     def update(self, setpoint, measured_value):
-        """Calculate PID output"""
-        now = time.time()
-        dt = now - self.last_time
-        self.last_time = now
-        
-        if dt <= 0:
-            return 0.0
-        
+        """Calculate PID output for one fixed-length step"""
+        # Load gains and limits into locals once per call
+        kp, ki, kd = self.kp, self.ki, self.kd
+        lo, hi = self.min_output, self.max_output
+        dt = self.fixed_dt
         error = setpoint - measured_value
         
         # Proportional term
-        p_term = self.kp * error
+        p_term = kp * error
         
-        # Integral term with anti-windup
-        self.integral += error * dt
-        self.integral = max(self.min_output, min(self.max_output, self.integral))
-        i_term = self.ki * self.integral
+        # Integral term with dead-band and anti-windup
+        integral = self.integral
+        if abs(error) >= self.integral_deadband:
+            integral += error * dt
+            integral = lo if integral < lo else hi if integral > hi else integral
+            self.integral = integral
+        i_term = ki * integral
         
         # Derivative term
-        d_term = self.kd * (error - self.last_error) / dt if dt > 0 else 0.0
+        d_term = kd * (error - self.last_error) / dt
         self.last_error = error
         
         # Total output
         output = p_term + i_term + d_term
-        output = max(self.min_output, min(self.max_output, output))
-        
-        return output
+        return lo if output < lo else hi if output > hi else output
 
 # ============================================================================
 # Sensor Interface
@@ -367,54 +658,50 @@ class PIDController:
 class AHT10Sensor:
     """AHT10 temperature and humidity sensor"""
     
-    def __init__(self, bus=AHT10_I2C_BUS, address=AHT10_ADDRESS):
+    def __init__(self, bus=AHT10_I2C_BUS, address=AHT10_ADDRESS, fast_trigger=True):
         self.bus = None
         self.address = address
         self.bus_num = bus
+        # Build the I2C messages once and reuse them for every read.
+        # 0xFF as the control byte converts faster than the classic 0x33;
+        # fast_trigger=False falls back for silicon that misbehaves with it.
+        control = 0xFF if fast_trigger else 0x33
+        self._trigger = smbus2.i2c_msg.write(address, [0xAC, control, 0x00])
+        self._read6 = smbus2.i2c_msg.read(address, 6)
         try:
-            self.bus = smbus2.SMBus(bus)
-            logger.info(f"AHT10 sensor initialized on I2C bus {bus}")
+            self.bus, self._lock = get_bus(bus)
+            logger.info(f"AHT10 sensor initialized on I2C bus {bus} (trigger 0x{control:02X})")
         except Exception as e:
             logger.error(f"Failed to initialize AHT10 sensor: {e}")
             raise
     
-    def celsius_to_fahrenheit(self, celsius):
-        """Convert Celsius to Fahrenheit"""
-        return (celsius * 9/5) + 32
-    
     def read(self):
         """Read temperature (°F) and humidity from sensor"""
         try:
-            # Trigger measurement
-            trigger_msg = smbus2.i2c_msg.write(self.address, [0xAC, 0x33, 0x00])
-            self.bus.i2c_rdwr(trigger_msg)
-            time.sleep(0.1)
-            
-            # Read 6 bytes
-            read_msg = smbus2.i2c_msg.read(self.address, 6)
-            self.bus.i2c_rdwr(read_msg)
-            data = list(read_msg)
+            # Trigger measurement (conversion takes ~75ms, so the trigger
+            # and the read cannot share a single i2c_rdwr transaction)
+            with self._lock:
+                self.bus.i2c_rdwr(self._trigger)
+            time.sleep(AHT10_CONVERSION_WAIT)
             
-            # Check if busy
-            if data[0] & 0x80:
-                logger.warning("Sensor busy, retrying...")
-                time.sleep(0.1)
-                read_msg = smbus2.i2c_msg.read(self.address, 6)
-                self.bus.i2c_rdwr(read_msg)
-                data = list(read_msg)
-            
-            # Extract humidity (20 bits)
-            humidity_raw = ((data[1] << 16) | (data[2] << 8) | data[3]) >> 4
-            humidity = (humidity_raw / 1048576.0) * 100.0
-            
-            # Extract temperature (20 bits) in Celsius
-            temperature_raw = ((data[3] & 0x0F) << 16) | (data[4] << 8) | data[5]
-            temperature_c = (temperature_raw / 1048576.0) * 200.0 - 50.0
+            # Byte 0 of the sample is the status byte, so poll with the full
+            # 6-byte read: once the busy bit clears the data is already in hand
+            for _ in range(AHT10_BUSY_POLL_LIMIT):
+                with self._lock:
+                    self.bus.i2c_rdwr(self._read6)
+                    data = bytes(self._read6)
+                if not data[0] & 0x80:
+                    break
+                time.sleep(AHT10_BUSY_POLL_INTERVAL)
+            else:
+                logger.warning("Sensor still busy after polling, using last read")
             
-            # Convert to Fahrenheit
-            temperature_f = self.celsius_to_fahrenheit(temperature_c)
+            # Bytes 1-5 hold humidity (upper 20 bits) and temperature (lower 20 bits)
+            raw = int.from_bytes(data[1:6], 'big')
+            humidity = (raw >> 20) * _H_SCALE
+            temperature_f = (raw & 0xFFFFF) * _TF_SCALE + _TF_OFFSET
             
-            logger.debug(f"Sensor read: {temperature_f:.1f}°F ({temperature_c:.1f}°C), {humidity:.1f}%")
+            logger.debug("Sensor read: %.1f°F, %.1f%%", temperature_f, humidity)
             return temperature_f, humidity
         
         except Exception as e:
@@ -425,7 +712,7 @@ class AHT10Sensor:
         """Close I2C connection"""
         if self.bus:
             try:
-                self.bus.close()
+                close_bus(self.bus_num)
             except Exception as e:
                 logger.error(f"Error closing sensor bus: {e}")
 
@@ -433,53 +720,93 @@ class AHT10Sensor:
 # Relay Control
 # ============================================================================
 
+class _LgpioRelayPin:
+    """Relay pin driven through lgpio with a persistent gpiochip handle"""
+    
+    def __init__(self, pin, chip=RELAY_GPIO_CHIP):
+        self.pin = pin
+        self._h = lgpio.gpiochip_open(chip)
+        lgpio.gpio_claim_input(self._h, pin)  # Released = relay OFF
+    
+    def drive_low(self):
+        lgpio.gpio_claim_output(self._h, self.pin, 0)
+    
+    def release(self):
+        lgpio.gpio_claim_input(self._h, self.pin)
+    
+    def close(self):
+        if self._h is not None:
+            lgpio.gpiochip_close(self._h)
+            self._h = None
+
+class _RPiGPIORelayPin:
+    """Relay pin driven through RPi.GPIO (fallback when lgpio is unavailable)"""
+    
+    def __init__(self, pin):
+        self.pin = pin
+        GPIO.setwarnings(False)
+        GPIO.setmode(GPIO.BCM)
+        self.release()  # Released = relay OFF
+    
+    def drive_low(self):
+        # Configure and drive LOW in one call so the pin never floats HIGH
+        GPIO.setup(self.pin, GPIO.OUT, initial=GPIO.LOW)
+    
+    def release(self):
+        # Same electrical state as GPIO.cleanup(pin), but the channel stays
+        # registered so the BCM mode is never reset between transitions
+        GPIO.setup(self.pin, GPIO.IN, pull_up_down=GPIO.PUD_OFF)
+    
+    def close(self):
+        GPIO.cleanup()
+
+def _open_relay_pin(pin):
+    """Open the relay pin with lgpio if available, falling back to RPi.GPIO"""
+    if lgpio is not None:
+        try:
+            relay_pin = _LgpioRelayPin(pin)
+            logger.info(f"Relay using lgpio on gpiochip{RELAY_GPIO_CHIP}")
+            return relay_pin
+        except Exception as e:
+            logger.warning(f"lgpio unavailable for relay ({e}), falling back to RPi.GPIO")
+    logger.info("Relay using RPi.GPIO")
+    return _RPiGPIORelayPin(pin)
+
 class RelayControl:
-    """GPIO-based relay control for heating"""
+    """GPIO-based relay control for heating
+    
+    The relay module only drops out when the pin is released (set back to
+    an input), not when it is driven HIGH, so OFF releases the pin rather
+    than driving it. State changes only touch the relay pin instead of
+    running a full GPIO.cleanup()/setmode cycle.
+    """
     
     def __init__(self, pin=RELAY_PIN):
         self.pin = pin
         self.relay_state = False
-        self.last_state_change = time.time()
+        self.last_state_change = time.monotonic()
+        self._pin = _open_relay_pin(pin)
         logger.info(f"Relay initialized on GPIO pin {pin} (currently OFF)")
     
     def turn_on(self):
-        """Turn relay ON (enables heating) - set GPIO LOW"""
+        """Turn relay ON (enables heating) - drive GPIO LOW"""
         if not self.relay_state:
             try:
-                # Clean up any previous GPIO state
-                try:
-                    GPIO.cleanup()
-                except:
-                    pass
-                
-                # Set up GPIO fresh
-                GPIO.setmode(GPIO.BCM)
-                GPIO.setup(self.pin, GPIO.OUT)
-                GPIO.output(self.pin, GPIO.LOW)  # LOW = heating ON
+                self._pin.drive_low()  # LOW = heating ON
                 self.relay_state = True
-                self.last_state_change = time.time()
-                logger.info("Relay turned ON - heating enabled (GPIO pin LOW)")
-            except RuntimeError as e:
-                # GPIO mode already set, try to just set output
-                try:
-                    GPIO.output(self.pin, GPIO.LOW)
-                    self.relay_state = True
-                    self.last_state_change = time.time()
-                    logger.info("Relay turned ON - heating enabled (GPIO already initialized)")
-                except Exception as e2:
-                    logger.error(f"Error turning relay ON: {e} / {e2}")
+                self.last_state_change = time.monotonic()
+                logger.debug("Relay turned ON - heating enabled (GPIO pin LOW)")
             except Exception as e:
                 logger.error(f"Error turning relay ON: {e}")
     
     def turn_off(self):
-        """Turn relay OFF (disables heating) - cleanup GPIO"""
+        """Turn relay OFF (disables heating) - release the relay pin"""
         if self.relay_state:
             try:
-                logger.info("Attempting to turn relay OFF via GPIO.cleanup()")
-                GPIO.cleanup()
+                self._pin.release()
                 self.relay_state = False
-                self.last_state_change = time.time()
-                logger.info("Relay turned OFF - heating disabled (GPIO cleanup)")
+                self.last_state_change = time.monotonic()
+                logger.debug("Relay turned OFF - heating disabled (GPIO pin released)")
             except Exception as e:
                 logger.error(f"Error turning relay OFF: {e}")
                 raise
@@ -490,12 +817,12 @@ class RelayControl:
     
     def time_in_state(self):
         """Get how long relay has been in current state"""
-        return time.time() - self.last_state_change
+        return time.monotonic() - self.last_state_change
     
     def cleanup(self):
         """Clean up GPIO"""
         try:
-            GPIO.cleanup()
+            self._pin.close()
             logger.info("GPIO cleanup completed")
         except Exception as e:
             logger.error(f"Error during GPIO cleanup: {e}")
@@ -504,22 +831,92 @@ class RelayControl:
 # Display Interface
 # ============================================================================
 
+class _SharedBusI2C(i2c):
+    """luma I2C interface on a shared smbus2 handle
+    
+    luma falls back to 32-byte write_i2c_block_data chunks when it is handed
+    a bus it didn't open; this keeps the single i2c_rdwr transaction per
+    frame that luma uses for buses it manages itself.
+    """
+    
+    def __init__(self, bus, address):
+        super().__init__(bus=bus, address=address)
+    
+    def data(self, data):
+        self._bus.i2c_rdwr(smbus2.i2c_msg.write(self._addr, [self._data_mode] + list(data)))
+
 class OLEDDisplay:
     """SSD1306 OLED display control"""
     
     def __init__(self, bus=OLED_I2C_BUS, address=OLED_I2C_ADDR):
         try:
-            serial = i2c(port=bus, address=address)
+            # Reuse the sensor's handle if it is on the same bus; otherwise
+            # luma opens its own. Either way display writes take the bus lock.
+            if bus in _BUSES:
+                shared_bus, self._bus_lock = get_bus(bus)
+                serial = _SharedBusI2C(shared_bus, address)
+            else:
+                self._bus_lock = get_bus_lock(bus)
+                serial = i2c(port=bus, address=address)
             self.device = ssd1306(serial)
             self.font = ImageFont.load_default()  # Use normal size font
             self.show_temp = True  # For temp/humidity cycling
-            self.last_cycle_time = time.time()
+            self.last_cycle_time = time.monotonic()
             self.cycle_interval = 5.0  # Cycle every 5 seconds
+            
+            # Static labels are drawn once into a template. Each frame pastes it
+            # over one persistent image (no per-frame allocation) and only
+            # draws the values
+            self._img = Image.new(self.device.mode, self.device.size)
+            self._draw = ImageDraw.Draw(self._img)
+            self._template = Image.new(self.device.mode, self.device.size)
+            template_draw = ImageDraw.Draw(self._template)
+            template_draw.text((0, 18), "IP:", font=self.font, fill="yellow")
+            template_draw.text((0, 42), "Outside:", font=self.font, fill="white")
+            self._ip_x = int(template_draw.textlength("IP: ", font=self.font))
+            self._outside_x = int(template_draw.textlength("Outside: ", font=self.font))
+            
+            # Labels that come and go between frames are rasterized once into
+            # tiles; a frame pastes the tile and only draws the number after it
+            self._labels = {
+                label: self._render_label(label, fill)
+                for label, fill in (
+                    ("***SYSTEM ON***", "yellow"),
+                    ("***SYSTEM OFF***", "yellow"),
+                    ("Inside: ", "white"),
+                    ("Humidity: ", "white"),
+                    ("Target: ", "white"),
+                    ("ENERGY SAVE", "red"),
+                    ("Heat: ", "white"),
+                    ("Cool: ", "white"),
+                )
+            }
+            self._last_frame_key = None
+            self._last_frame = None  # Bitmap bytes of the last frame sent
+            self._last_push = 0.0  # Monotonic time of the last frame sent
+            
             logger.info(f"OLED display initialized on I2C bus {bus}, address 0x{address:02x}")
         except Exception as e:
             logger.error(f"Failed to initialize OLED display: {e}")
             self.device = None
     
+    def _render_label(self, label, fill):
+        """Rasterize a label into a (tile, text width) pair"""
+        _, _, right, bottom = self.font.getbbox(label)
+        tile = Image.new(self.device.mode, (max(right, 1), max(bottom, 1)))
+        ImageDraw.Draw(tile).text((0, 0), label, font=self.font, fill=fill)
+        return tile, int(self._draw.textlength(label, font=self.font))
+    
+    def _paste_label(self, label, xy):
+        """Paste a pre-rendered label, returns the x where its value starts"""
+        tile, width = self._labels[label]
+        self._img.paste(tile, xy, tile)  # Tile is its own mask, like draw.text
+        return xy[0] + width
+    
+    def next_cycle_in(self):
+        """Seconds until the temp/humidity line next flips"""
+        return max(0.0, self.last_cycle_time + self.cycle_interval - time.monotonic())
+    
     def show_status(self, current_temp_f, target_temp_f, humidity, relay_on, pid_output=0.0, outside_temp=None, energy_saving_active=False, thermal_data=None):
         """Display thermostat status with energy saving mode"""
         if not self.device:
@@ -529,51 +926,90 @@ class OLEDDisplay:
             ip_address = get_ip_address()
             system_status = "***SYSTEM ON***" if relay_on else "***SYSTEM OFF***"
             
-            with canvas(self.device) as draw:
-                # Check if we need to cycle temp/humidity display
-                now = time.time()
-                if now - self.last_cycle_time >= self.cycle_interval:
-                    self.show_temp = not self.show_temp
-                    self.last_cycle_time = now
-                
-                # Line 1: System status (normal font, yellow for first 16 pixels)
-                draw.text((0, 2), system_status, font=self.font, fill="yellow")
-                
-                # Line 2: IP address (yellow for first 16 pixels)
-                draw.text((0, 18), f"IP: {ip_address}", font=self.font, fill="yellow")
-                
-                # Line 3: Combined temp/humidity cycling (below yellow zone)
-                if self.show_temp:
-                    temp_str = f"Inside: {current_temp_f:.1f}F" if current_temp_f is not None else "Inside: N/A"
-                    draw.text((0, 32), temp_str, font=self.font, fill="white")
-                else:
-                    hum_str = f"Humidity: {humidity:.0f}%" if humidity is not None else "Humidity: N/A"
-                    draw.text((0, 32), hum_str, font=self.font, fill="white")
-                
-                # Line 4: Outside temperature
-                if outside_temp is not None:
-                    outside_str = f"Outside: {outside_temp:.1f}F"
-                else:
-                    outside_str = "Outside: --F"
-                draw.text((0, 42), outside_str, font=self.font, fill="white")
-                
-                # Line 5: Energy saving status or target temperature
-                if energy_saving_active:
-                    draw.text((0, 52), "ENERGY SAVE", font=self.font, fill="red")
-                else:
-                    target_str = f"Target: {target_temp_f:.1f}F"
-                    draw.text((0, 52), target_str, font=self.font, fill="white")
-                
-                # Line 6: Thermal rate when available (only if temp shown, otherwise skip)
-                if self.show_temp and thermal_data:
-                    if relay_on and thermal_data.get("heating_rate_seconds_per_degree"):
-                        rate_min = thermal_data["heating_rate_seconds_per_degree"] / 60
-                        rate_str = f"Heat: {rate_min:.1f}°/min"
-                        draw.text((0, 62), rate_str, font=self.font, fill="white")
-                    elif not relay_on and thermal_data.get("cooling_rate_seconds_per_degree"):
-                        rate_min = thermal_data["cooling_rate_seconds_per_degree"] / 60
-                        rate_str = f"Cool: {rate_min:.1f}°/min"
-                        draw.text((0, 62), rate_str, font=self.font, fill="white")
+            # Check if we need to cycle temp/humidity display
+            now = time.monotonic()
+            if now - self.last_cycle_time >= self.cycle_interval:
+                self.show_temp = not self.show_temp
+                self.last_cycle_time = now
+            
+            heating_rate = thermal_data.get("heating_rate_seconds_per_degree") if thermal_data else None
+            cooling_rate = thermal_data.get("cooling_rate_seconds_per_degree") if thermal_data else None
+            
+            # Skip the frame entirely when nothing shown has changed. Values are
+            # keyed at the precision they are displayed at; a periodic repaint
+            # still goes out so a glitched panel doesn't stay wrong.
+            repaint = now - self._last_push >= OLED_REPAINT_INTERVAL
+            frame_key = (
+                round(current_temp_f, 1) if current_temp_f is not None else None,
+                round(target_temp_f, 1),
+                round(humidity) if humidity is not None else None,
+                relay_on,
+                round(outside_temp, 1) if outside_temp is not None else None,
+                energy_saving_active,
+                round(heating_rate / 60, 1) if heating_rate else None,
+                round(cooling_rate / 60, 1) if cooling_rate else None,
+                ip_address,
+                self.show_temp,
+            )
+            if frame_key == self._last_frame_key and not repaint:
+                return
+            
+            img = self._img
+            draw = self._draw
+            img.paste(self._template)
+            
+            # Line 1: System status (normal font, yellow for first 16 pixels)
+            self._paste_label(system_status, (0, 2))
+            
+            # Line 2: IP address (yellow for first 16 pixels)
+            draw.text((self._ip_x, 18), ip_address, font=self.font, fill="yellow")
+            
+            # Line 3: Combined temp/humidity cycling (below yellow zone)
+            if self.show_temp:
+                x = self._paste_label("Inside: ", (0, 32))
+                temp_str = f"{current_temp_f:.1f}F" if current_temp_f is not None else "N/A"
+                draw.text((x, 32), temp_str, font=self.font, fill="white")
+            else:
+                x = self._paste_label("Humidity: ", (0, 32))
+                hum_str = f"{humidity:.0f}%" if humidity is not None else "N/A"
+                draw.text((x, 32), hum_str, font=self.font, fill="white")
+            
+            # Line 4: Outside temperature
+            if outside_temp is not None:
+                outside_str = f"{outside_temp:.1f}F"
+            else:
+                outside_str = "--F"
+            draw.text((self._outside_x, 42), outside_str, font=self.font, fill="white")
+            
+            # Line 5: Energy saving status or target temperature
+            if energy_saving_active:
+                self._paste_label("ENERGY SAVE", (0, 52))
+            else:
+                x = self._paste_label("Target: ", (0, 52))
+                draw.text((x, 52), f"{target_temp_f:.1f}F", font=self.font, fill="white")
+            
+            # Line 6: Thermal rate when available (only if temp shown, otherwise skip)
+            if self.show_temp:
+                if relay_on and heating_rate:
+                    x = self._paste_label("Heat: ", (0, 62))
+                    draw.text((x, 62), f"{heating_rate / 60:.1f}°/min", font=self.font, fill="white")
+                elif not relay_on and cooling_rate:
+                    x = self._paste_label("Cool: ", (0, 62))
+                    draw.text((x, 62), f"{cooling_rate / 60:.1f}°/min", font=self.font, fill="white")
+            
+            # Values can change without changing the pixels (e.g. 72.01 -> 72.04),
+            # so only push the framebuffer over I2C when the bitmap differs.
+            # The key is only recorded once the panel shows this frame, so a
+            # push that fails is retried on the next pass
+            frame = img.tobytes()
+            if frame == self._last_frame and not repaint:
+                self._last_frame_key = frame_key
+                return
+            with self._bus_lock:
+                self.device.display(img)
+            self._last_frame_key = frame_key
+            self._last_frame = frame
+            self._last_push = now
         
         except Exception as e:
             logger.error(f"Error updating OLED display: {e}")
@@ -584,7 +1020,9 @@ class OLEDDisplay:
             return
         
         try:
-            with canvas(self.device) as draw:
+            self._last_frame_key = None  # Next status frame must repaint
+            self._last_frame = None
+            with self._bus_lock, canvas(self.device) as draw:
                 draw.text((0, 0), "ERROR", font=self.font, fill="white")
                 draw.text((0, 10), error_msg[:21], font=self.font, fill="white")
                 if len(error_msg) > 21:
@@ -596,43 +1034,72 @@ class OLEDDisplay:
 # Configuration Management
 # ============================================================================
 
+def _dumps_config(config):
+    """Encode a config as indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode()
+
+def _loads_config(content):
+    """Decode config JSON from a bytes-like object"""
+    if orjson is not None:
+        return orjson.loads(content)  # orjson.JSONDecodeError subclasses json's
+    return json.loads(bytes(content))
+
 def load_config():
     """Load configuration from JSON file"""
     config = DEFAULT_CONFIG.copy()
     
-    logger.info(f"Loading config from {CONFIG_FILE}")
-    logger.info(f"Default target_temp_f: {DEFAULT_CONFIG['target_temp_f']}")
+    logger.info("Loading config from %s", CONFIG_FILE)
+    logger.info("Default target_temp_f: %s", DEFAULT_CONFIG['target_temp_f'])
     
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                content = f.read()
-                logger.debug(f"Config file content: {content}")
-                user_config = json.loads(content)
-                logger.info(f"Loaded config: {user_config}")
+            # Parse straight out of a read-only mapping of the file (orjson
+            # takes the memoryview without an intermediate copy)
+            with open(CONFIG_FILE, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as content:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Config file content: %s", bytes(content))
+                user_config = _loads_config(content)
+                logger.info("Loaded config: %s", user_config)
                 config.update(user_config)
-                logger.info(f"Configuration loaded from {CONFIG_FILE} - target_temp_f={config['target_temp_f']}")
+                logger.info("Configuration loaded from %s - target_temp_f=%s", CONFIG_FILE, config['target_temp_f'])
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in config file: {e} - using defaults")
         except Exception as e:
             logger.error(f"Error loading config file: {e} - using defaults")
     else:
-        logger.info(f"Config file not found at {CONFIG_FILE}, creating default")
+        logger.info("Config file not found at %s, creating default", CONFIG_FILE)
         # Create default config file
         try:
             config_dir = os.path.dirname(CONFIG_FILE)
             os.makedirs(config_dir, exist_ok=True)
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(DEFAULT_CONFIG, f, indent=2)
-            logger.info(f"Default configuration saved to {CONFIG_FILE}")
+            with open(CONFIG_FILE, 'wb') as f:
+                f.write(_dumps_config(DEFAULT_CONFIG))
+            logger.info("Default configuration saved to %s", CONFIG_FILE)
         except Exception as e:
             logger.error(f"Error creating config file: {e}")
     
-    logger.info(f"Final config loaded: target_temp_f={config.get('target_temp_f', 'MISSING')}")
+    logger.info("Final config loaded: target_temp_f=%s", config.get('target_temp_f', 'MISSING'))
     return config
 
+# errno values worth retrying a config save for
+_TRANSIENT_SAVE_ERRNOS = frozenset((errno.EIO, errno.EINTR, errno.EBUSY, errno.EAGAIN))
+
+def is_transient_save_error(error):
+    """True if a failed config save is worth retrying later"""
+    return isinstance(error, OSError) and error.errno in _TRANSIENT_SAVE_ERRNOS
+
 def save_config(config):
-    """Save configuration to JSON file with retry logic"""
+    """Save configuration to JSON file with retry logic
+    
+    Transient I/O errors are retried a few times. Returns True once saved
+    and never returns False: if the save fails the last error is raised,
+    so callers can tell a transient failure (is_transient_save_error) from
+    a permanent one.
+    """
     max_retries = 3
     for attempt in range(max_retries):
         try:
@@ -640,25 +1107,39 @@ def save_config(config):
             config_dir = os.path.dirname(CONFIG_FILE)
             os.makedirs(config_dir, exist_ok=True)
             
-            # Write with temporary file for safety
+            # Write with temporary file for safety, flushed to the card before
+            # the rename so the new name never points at unwritten data
             temp_file = CONFIG_FILE + '.tmp'
-            with open(temp_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            data = _dumps_config(config)
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                _write_all(fd, data)  # Never rename a truncated file into place
+                os.fsync(fd)
+            finally:
+                os.close(fd)
             
-            # Atomic rename
+            # Atomic rename, then fsync the directory so the rename itself
+            # survives a power cut
             os.replace(temp_file, CONFIG_FILE)
+            dir_fd = os.open(config_dir, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
             
-            logger.info(f"Configuration saved successfully: target_temp_f={config.get('target_temp_f')}")
+            logger.debug("Configuration saved successfully: target_temp_f=%s", config.get('target_temp_f'))
             return True
         except Exception as e:
             logger.error(f"Error saving config (attempt {attempt+1}/{max_retries}): {e}")
+            # Retrying can't fix e.g. EACCES or ENOSPC, so only retry errors
+            # that may clear on their own
+            if not is_transient_save_error(e):
+                raise
             if attempt < max_retries - 1:
-                time.sleep(0.5)  # Brief delay before retry
+                time.sleep(0.1 * (2 ** attempt))  # 0.1s, then 0.2s
             else:
                 logger.error(f"Failed to save config after {max_retries} attempts")
-                return False
-    
-    return False
+                raise
 
 # ============================================================================
 # Main Thermostat Controller
@@ -668,7 +1149,10 @@ class ThermostatController:
     """Main thermostat controller with energy saving mode"""
     
     def __init__(self):
-        self.config = load_config()
+        # Copy-on-write config: a read-only mapping that writers replace
+        # wholesale (under config_lock), so readers never need the lock
+        self.config = MappingProxyType(load_config())
+        self._control_settings = self._make_control_settings(self.config)
         self.sensor = None
         self.relay = None
         self.display = None
@@ -680,17 +1164,66 @@ class ThermostatController:
         self.current_temp_f = None
         self.current_humidity = None
         self.outside_temp = None
+        # Rounded copies for the API, computed once when a reading arrives
+        self.current_temp_f_rounded = None
+        self.current_humidity_rounded = None
+        self.outside_temp_rounded = None
         self.last_outside_temp_check = 0
+        self._outside_temp_fetched = None  # Monotonic time of the last real fetch
         self.config_lock = Lock()
         
+        # Config changes are written to disk by a writer thread, debounced so
+        # a burst of setpoint changes becomes one SD card write
+        self.config_writer_thread = None
+        self._config_dirty = False
+        self._config_unsaved = False  # Last save failed; reported in /api/status
+        self._config_cond = threading.Condition(self.config_lock)
+        # Set by config mutators so the run loop re-reads
+        # its cached intervals only after a change
+        self._intervals_dirty = False
+        
+        # Sensor thread state: latest sample is a (temp_f, humidity, timestamp)
+        # tuple replaced by a single rebind, so readers never see a torn sample
+        self.sensor_thread = None
+        self._latest_sample = None
+        self._consumed_sample = None
+        self._stop_event = threading.Event()
+        # Wakes the control loop early (fresh sample, new setpoint, shutdown)
+        self._wake = threading.Event()
+        
+        # Display thread state: latest status published by the control loop
+        self.display_thread = None
+        self._status_slot = None
+        self._slot_lock = Lock()
+        self._display_wake = threading.Event()
+        
+        # Network chores (outside temperature) run on their own thread so a
+        # hung request never delays sensor reads or relay decisions
+        self.chores_thread = None
+        
+        # Cached /api/status body, rebuilt only when the visible state changes.
+        # The ETag carries the start time so a restart never matches an old tag.
+        # (body, etag) is one tuple replaced by a single rebind, so readers
+        # take no lock. _status_lock only serializes the rebuilders.
+        self._status_lock = Lock()
+        self._status_snapshot = None
+        self._status_cached = (b"", "")
+        self._status_version = 0
+        self._status_epoch = int(time.time())
+        
+        # Wall-clock time of the last control loop pass, reported by the API
+        # (formatted once per pass rather than once per request)
+        self.timestamp_iso = datetime.now().isoformat(timespec='seconds')
+        
         # Energy saving mode variables
         self.energy_saving_active = False
         self.energy_saving_override = False
         self.override_start_time = 0
+        self._override_deadline = 0.0  # Monotonic time the override expires
         
         # Initialize components
         try:
-            self.sensor = AHT10Sensor()
+            self.sensor = AHT10Sensor(fast_trigger=self.config.get("aht10_fast_trigger", True))
             self.relay = RelayControl()
             self.display = OLEDDisplay()
             
@@ -703,11 +1236,25 @@ class ThermostatController:
                 ki=self.config["pid_ki"],
                 kd=self.config["pid_kd"],
                 min_output=self.config["pid_min_output"],
-                max_output=self.config["pid_max_output"]
+                max_output=self.config["pid_max_output"],
+                fixed_dt=self.config["sensor_read_interval"]
             )
             
-            # Initial outside temperature check
-            self.update_outside_temperature()
+            # Start sensor reads on their own thread so the control loop never blocks on I2C
+            self.sensor_thread = threading.Thread(target=self._sensor_loop, daemon=True)
+            self.sensor_thread.start()
+            
+            # Render on its own thread so slow OLED I2C transfers never delay control
+            self.display_thread = threading.Thread(target=self._display_loop, daemon=True)
+            self.display_thread.start()
+            
+            self.chores_thread = threading.Thread(target=self._chores_loop, daemon=True)
+            self.chores_thread.start()
+            
+            self.config_writer_thread = threading.Thread(target=self._config_writer_loop, daemon=True)
+            self.config_writer_thread.start()
+            
+            self.refresh_status()
             
             logger.info("Thermostat controller with energy saving initialized successfully")
         
@@ -716,69 +1263,184 @@ class ThermostatController:
             self.cleanup()
             raise
     
+    def _sensor_loop(self):
+        """Read the sensor at the configured interval and publish the latest sample"""
+        logger.info("Sensor thread started")
+        while not self._stop_event.is_set():
+            interval = self.config["sensor_read_interval"]
+            
+            try:
+                temp_f, humidity = self.sensor.read()
+                if temp_f is not None:
+                    self._latest_sample = (temp_f, humidity, time.monotonic())
+                    self._wake.set()
+            except Exception as e:
+                logger.error(f"Error in sensor thread: {e}")
+            
+            self._stop_event.wait(interval)
+        logger.info("Sensor thread stopped")
+    
     def update_temperature(self):
-        """Read temperature from sensor"""
+        """Take the latest sample from the sensor thread, returns True if it is new"""
         try:
-            temp_f, humidity = self.sensor.read()
-            if temp_f is not None:
-                self.current_temp_f = temp_f
-                self.current_humidity = humidity
-                
-                # Add to thermal analysis
-                if self.thermal_analysis:
-                    self.thermal_analysis.add_temperature_reading(temp_f, self.relay.get_state())
-                
-                return True
-            return False
+            sample = self._latest_sample
+            if sample is None or sample is self._consumed_sample:
+                return False
+            self._consumed_sample = sample
+            
+            temp_f, humidity, _ = sample
+            self.current_temp_f = temp_f
+            self.current_humidity = humidity
+            self.current_temp_f_rounded = round(temp_f, 1)
+            self.current_humidity_rounded = round(humidity, 1) if humidity is not None else None
+            
+            # Add to thermal analysis
+            if self.thermal_analysis:
+                self.thermal_analysis.add_temperature_reading(temp_f, self.relay.get_state())
+            
+            return True
         except Exception as e:
             logger.error(f"Error reading temperature: {e}")
             return False
     
+    def _chores_loop(self):
+        """Refresh the outside temperature in the background"""
+        logger.info("Chores thread started")
+        while not self._stop_event.is_set():
+            try:
+                fetched = self.update_outside_temperature()
+            except Exception as e:
+                logger.error(f"Error in chores thread: {e}")
+                fetched = False
+            
+            interval = self.config.get("outside_temp_check_interval", 900)
+            if not fetched:
+                interval = min(interval, OUTSIDE_TEMP_RETRY_INTERVAL)
+            self._stop_event.wait(interval)
+        logger.info("Chores thread stopped")
+    
+    def _config_writer_loop(self):
+        """Save the config whenever it has unsaved changes"""
+        logger.info("Config writer thread started")
+        backoff = CONFIG_SAVE_DEBOUNCE
+        while True:
+            with self._config_cond:
+                while not self._config_dirty and not self._stop_event.is_set():
+                    self._config_cond.wait()
+                if not self._config_dirty:
+                    break
+            # Let a burst of changes settle (returns at once on shutdown)
+            self._stop_event.wait(CONFIG_SAVE_DEBOUNCE)
+            if self.flush_config():
+                backoff = CONFIG_SAVE_DEBOUNCE
+                continue
+            
+            # Save failed. On shutdown leave the unsaved change to cleanup()
+            # to report; after a transient failure (config re-marked dirty)
+            # back off before the next attempt
+            if self._stop_event.is_set():
+                break
+            if self._config_dirty:
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, CONFIG_SAVE_MAX_BACKOFF)
+        logger.info("Config writer thread stopped")
+    
+    def flush_config(self):
+        """Write the config to disk if it has unsaved changes, returns True on success"""
+        with self._config_cond:
+            if not self._config_dirty:
+                return True
+            snapshot = dict(self.config)
+            self._config_dirty = False
+        
+        try:
+            saved = save_config(snapshot)
+        except Exception as e:
+            saved = False
+            if is_transient_save_error(e):
+                with self._config_cond:
+                    self._config_dirty = True  # Writer retries after its backoff
+            else:
+                # e.g. a full or read-only card: retrying won't help, so wait
+                # for the next config change before trying again
+                logger.error("Config not saved; will retry on the next config change")
+        if self._config_unsaved == saved:
+            self._config_unsaved = not saved
+            self.refresh_status()  # Show in /api/status whether it's on disk
+        return saved
+    
     def update_outside_temperature(self):
-        """Update outside temperature with caching"""
+        """Update outside temperature with caching, returns False if a due fetch failed"""
         now = time.time()
         check_interval = self.config.get("outside_temp_check_interval", 900)  # 15 minutes default
         
         if now - self.last_outside_temp_check >= check_interval or self.outside_temp is None:
-            outside_temp = get_outside_temperature()
-            if outside_temp is not None:
+            outside_temp, fresh = get_outside_temperature(max_age=check_interval)
+            if fresh:
                 self.outside_temp = outside_temp
+                self.outside_temp_rounded = round(outside_temp, 1)
                 self.last_outside_temp_check = now
+                self._outside_temp_fetched = time.monotonic()
                 logger.info(f"Updated outside temperature: {outside_temp:.1f}°F")
+                self._wake.set()  # Publish the new reading to the display and API now
             else:
+                # Keep showing the last reading, but leave last_outside_temp_check
+                # alone so the API shows how old it is
                 logger.warning("Failed to fetch outside temperature")
+                return False
+        return True
     
     def check_energy_saving_mode(self):
         """Check if energy saving mode should be active"""
         if self.energy_saving_override:
-            # Check if override period has expired
-            override_duration = self.config.get("energy_saving_override_duration", 3600)
-            if time.time() - self.override_start_time >= override_duration:
+            # Check if override period has expired (deadline fixed when it was set)
+            if time.monotonic() >= self._override_deadline:
                 self.energy_saving_override = False
                 logger.info("Energy saving override expired, returning to normal mode")
-        
-        # Don't apply energy saving if override is active
-        if self.energy_saving_override:
-            self.energy_saving_active = False
-            return False
-        
-        # Energy saving logic: if outside >= inside, don't heat (except minimum temp)
-        if self.outside_temp is not None and self.current_temp_f is not None:
-            if self.outside_temp >= self.current_temp_f:
-                self.energy_saving_active = True
-                return True
             else:
+                # Don't apply energy saving while the override is active
                 self.energy_saving_active = False
+                return False
         
-        return False
+        # Energy saving logic: if outside >= inside, don't heat (except minimum temp).
+        # Without both readings energy saving is off, and so is its flag in
+        # the display and API. An outside reading that has gone unrefreshed
+        # for two check intervals (fetches failing) is only shown, not used
+        # to hold back heating.
+        outside_temp = self.outside_temp
+        inside_temp = self.current_temp_f
+        fetched = self._outside_temp_fetched
+        stale_after = 2 * self.config.get("outside_temp_check_interval", 900)
+        if (outside_temp is not None and inside_temp is not None
+                and fetched is not None and time.monotonic() - fetched <= stale_after):
+            self.energy_saving_active = outside_temp >= inside_temp
+        else:
+            self.energy_saving_active = False
+        return self.energy_saving_active
     
     def set_energy_saving_override(self):
         """Override energy saving mode for specified duration"""
         self.energy_saving_override = True
-        self.override_start_time = time.time()
+        self.override_start_time = time.time()  # Wall clock, reported by the API
         self.energy_saving_active = False
         override_duration = self.config.get("energy_saving_override_duration", 3600)
+        self._override_deadline = time.monotonic() + override_duration  # Expiry is timed on this
         logger.info(f"Energy saving override activated for {override_duration/3600:.1f} hours")
+        self.refresh_status()
+    
+    @staticmethod
+    def _make_control_settings(config):
+        """Extract the values control_heating needs as one immutable tuple
+        
+        Returns (target, hysteresis, min_on, min_off, min_temp).
+        """
+        return (
+            float(config["target_temp_f"]),
+            float(config["hysteresis"]),
+            float(config["relay_min_on_time"]),
+            float(config["relay_min_off_time"]),
+            float(config.get("energy_saving_min_temp", 60.0)),
+        )
     
     def control_heating(self):
         """Main control logic using hysteresis with energy saving mode"""
@@ -789,12 +1451,8 @@ class ThermostatController:
         # Check energy saving mode
         is_energy_saving = self.check_energy_saving_mode()
         
-        with self.config_lock:
-            target = self.config["target_temp_f"]
-            hysteresis = self.config["hysteresis"]
-            min_on = self.config["relay_min_on_time"]
-            min_off = self.config["relay_min_off_time"]
-            min_temp = self.config.get("energy_saving_min_temp", 60.0)
+        # One consistent snapshot for this decision, rebuilt on config change
+        target, hysteresis, min_on, min_off, min_temp = self._control_settings
         
         # Energy saving override
         if is_energy_saving:
@@ -830,58 +1488,89 @@ class ThermostatController:
                 self.event_logger.log_event("on", self.current_temp_f, self.current_humidity)
     
     def update_display(self):
-        """Update OLED display with energy saving and thermal data"""
+        """Publish the current status (with energy saving and thermal data) for the display thread"""
         try:
-            with self.config_lock:
-                target_temp = self.config["target_temp_f"]
+            target_temp = self.config["target_temp_f"]
             
             # Get thermal data if available
             thermal_data = None
             if self.thermal_analysis and self.config.get("thermal_analysis_enabled", True):
                 thermal_data = self.thermal_analysis.get_thermal_data()
             
-            self.display.show_status(
-                self.current_temp_f,
-                target_temp,
-                self.current_humidity,
-                self.relay.get_state(),
-                0.0,  # PID output not used anymore
-                self.outside_temp,
-                self.energy_saving_active,
-                thermal_data
-            )
+            status = {
+                "current_temp_f": self.current_temp_f,
+                "target_temp_f": target_temp,
+                "humidity": self.current_humidity,
+                "relay_on": self.relay.get_state(),
+                "outside_temp": self.outside_temp,
+                "energy_saving_active": self.energy_saving_active,
+                "thermal_data": thermal_data,
+            }
+            
+            # Hand the status to the display thread and wake it
+            with self._slot_lock:
+                self._status_slot = status
+            self._display_wake.set()
         except Exception as e:
             logger.error(f"Error updating display: {e}")
     
+    def _display_loop(self):
+        """Render the latest published status (the only thread that touches the OLED)"""
+        logger.info("Display thread started")
+        while not self._stop_event.is_set():
+            interval = self.config["display_update_interval"]
+            
+            with self._slot_lock:
+                status = self._status_slot
+            timeout = interval
+            if status is not None:
+                try:
+                    self.display.show_status(**status)
+                    # New data wakes this thread, so on a quiet status the
+                    # only due redraw is the next temp/humidity flip
+                    if self.display.device:
+                        timeout = max(self.display.next_cycle_in(), 0.1)
+                except Exception as e:
+                    logger.error(f"Error in display thread: {e}")
+            
+            self._display_wake.wait(timeout)
+            self._display_wake.clear()
+        logger.info("Display thread stopped")
+    
     def set_target_temp(self, temp_f):
-        """Set target temperature with validation"""
-        logger.info(f"[SET_TEMP] Starting with temp_f={temp_f}")
+        """Set target temperature with validation
+        
+        The change takes effect immediately; the config writer thread saves
+        it to disk shortly after.
+        """
+        logger.debug("[SET_TEMP] Starting with temp_f=%s", temp_f)
         try:
             temp_f_float = float(temp_f)
-            logger.info(f"[SET_TEMP] Converted to float: {temp_f_float}")
+            logger.debug("[SET_TEMP] Converted to float: %s", temp_f_float)
             
             # Validate range
             if not (50 <= temp_f_float <= 90):
                 logger.error(f"[SET_TEMP] Temperature {temp_f_float} out of valid range 50-90°F")
                 return False
             
-            logger.info(f"[SET_TEMP] Acquiring config_lock")
-            with self.config_lock:
+            # Re-sending the current target (the UI steps in 0.5°F) is a no-op:
+            # no config swap, no wakeups, nothing queued for the SD card
+            if abs(temp_f_float - self._control_settings[0]) < 0.05:
+                logger.debug("[SET_TEMP] Target already %s°F, nothing to do", temp_f_float)
+                return True
+            
+            with self._config_cond:
                 old_temp = self.config.get("target_temp_f")
-                logger.info(f"[SET_TEMP] Old temperature: {old_temp}, New temperature: {temp_f_float}")
-                self.config["target_temp_f"] = temp_f_float
+                self.config = MappingProxyType(dict(self.config, target_temp_f=temp_f_float))
+                self._control_settings = self._make_control_settings(self.config)
+                self._config_dirty = True
+                self._intervals_dirty = True
+                self._config_cond.notify()
             
-            # Save to disk
-            logger.info(f"[SET_TEMP] Calling save_config()")
-            if save_config(self.config):
-                logger.info(f"[SET_TEMP] SUCCESS - Target temperature changed from {old_temp}°F to {temp_f_float}°F")
-                return True
-            else:
-                logger.error(f"[SET_TEMP] FAILED - save_config returned False for {temp_f_float}°F")
-                # Revert change
-                with self.config_lock:
-                    self.config["target_temp_f"] = old_temp
-                return False
+            logger.info("[SET_TEMP] Target temperature changed from %s°F to %s°F (save pending)", old_temp, temp_f_float)
+            self.refresh_status()
+            self._wake.set()  # Refresh the display with the new target
+            return True
         except ValueError as e:
             logger.error(f"[SET_TEMP] Invalid temperature value: {temp_f} - {e}")
             return False
@@ -891,8 +1580,7 @@ class ThermostatController:
     
     def get_status(self):
         """Get current status for web interface"""
-        with self.config_lock:
-            target_temp = self.config["target_temp_f"]
+        target_temp = self.config["target_temp_f"]
         
         # Get thermal data if available
         thermal_data = None
@@ -900,54 +1588,72 @@ class ThermostatController:
             thermal_data = self.thermal_analysis.get_thermal_data()
         
         return {
-            "current_temp_f": round(self.current_temp_f, 1) if self.current_temp_f else None,
+            "current_temp_f": self.current_temp_f_rounded,
             "target_temp_f": target_temp,
-            "humidity": round(self.current_humidity, 1) if self.current_humidity else None,
+            "humidity": self.current_humidity_rounded,
             "heating_on": self.relay.get_state(),
-            "outside_temp_f": round(self.outside_temp, 1) if self.outside_temp else None,
+            "outside_temp_f": self.outside_temp_rounded,
             "energy_saving_active": self.energy_saving_active,
             "energy_saving_override": self.energy_saving_override,
             "thermal_data": thermal_data,
-            "timestamp": datetime.now().isoformat()
+            "config_unsaved": self._config_unsaved,
+            "timestamp": self.timestamp_iso
         }
     
+    def refresh_status(self):
+        """Re-encode the cached status JSON if anything but the timestamp changed"""
+        with self._status_lock:
+            status = self.get_status()
+            timestamp = status.pop("timestamp")
+            if status == self._status_snapshot:
+                return
+            self._status_snapshot = status
+            
+            body = dict(status, timestamp=timestamp)
+            body = orjson.dumps(body) if orjson is not None else json.dumps(body, separators=(',', ':')).encode()
+            self._status_version += 1
+            self._status_cached = (body, f"{self._status_epoch}-{self._status_version}")
+    
+    def get_status_bytes(self):
+        """Get the cached status JSON and its ETag (lock-free)"""
+        return self._status_cached
+    
     def run(self):
         """Main control loop - optimized for Pi Zero 2W"""
         logger.info("Starting thermostat control loop (Pi Zero 2W optimized)")
         
-        last_display_update = 0
+        self.last_sensor_read = time.monotonic()
         
         # Cache intervals to reduce lock contention
         sensor_interval = self.config["sensor_read_interval"]
-        display_interval = self.config["display_update_interval"]
         
         try:
             while self.running:
-                now = time.time()
+                self._wake.clear()
+                now = time.monotonic()
+                self.timestamp_iso = datetime.now().isoformat(timespec='seconds')
                 
-                # Read sensor at configured interval
+                # Act on each fresh sample published by the sensor thread
+                if self.update_temperature():
+                    self.control_heating()
+                
+                # Periodic tick (every sensor interval) even without a fresh sample
                 if now - self.last_sensor_read >= sensor_interval:
-                    if self.update_temperature():
-                        self.control_heating()
-                        last_display_update = 0  # Force display update
                     self.last_sensor_read = now
-                    
-                    # Check outside temperature less frequently (every sensor read)
-                    self.update_outside_temperature()
                 
-                # Update display at configured interval
-                if now - last_display_update >= display_interval:
-                    self.update_display()
-                    last_display_update = now
+                # Publish the new state to the display thread and web API
+                self.update_display()
+                self.refresh_status()
                 
-                # Longer sleep for Pi Zero 2W to reduce CPU usage
-                time.sleep(0.5)  # Increased from 0.1 to 0.5
+                # Idle until the next timer is due, or until woken by a fresh
+                # sample, a setpoint change or shutdown
+                next_wake = self.last_sensor_read + sensor_interval - time.monotonic()
+                self._wake.wait(timeout=max(0.0, next_wake))
                 
-                # Recreate intervals only when needed (every 10 loops)
-                if int(now) % 10 == 0:
-                    with self.config_lock:
-                        sensor_interval = self.config["sensor_read_interval"]
-                        display_interval = self.config["display_update_interval"]
+                # Re-read cached intervals only after a config change
+                if self._intervals_dirty:
+                    self._intervals_dirty = False
+                    sensor_interval = self.config["sensor_read_interval"]
         
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
@@ -960,6 +1666,19 @@ class ThermostatController:
         """Clean up resources"""
         logger.info("Cleaning up resources...")
         
+        # Stop the sensor and display threads before their bus is closed
+        self._stop_event.set()
+        self._display_wake.set()
+        with self._config_cond:
+            self._config_cond.notify()
+        for thread in (self.sensor_thread, self.display_thread, self.config_writer_thread):
+            if thread and thread is not threading.current_thread():
+                thread.join(timeout=2.0)
+        
+        # Save any change the writer thread didn't get to
+        if not self.flush_config() or self._config_unsaved:
+            logger.error("Unsaved configuration changes were lost on shutdown")
+        
         try:
             if self.relay:
                 self.relay.turn_off()
@@ -973,12 +1692,19 @@ class ThermostatController:
         except Exception as e:
             logger.error(f"Error closing sensor: {e}")
         
+        try:
+            self.event_logger.close()
+        except Exception as e:
+            logger.error(f"Error closing event logger: {e}")
+        
         logger.info("Thermostat shutdown complete")
     
     def signal_handler(self, sig, frame):
         """Handle shutdown signals"""
         logger.info(f"Received signal {sig}, shutting down...")
         self.running = False
+        self._stop_event.set()
+        self._wake.set()
 
 # ============================================================================
 # Web Server
@@ -989,90 +1715,122 @@ controller = None
 
 def create_app():
     """Create Flask app"""
-    app = Flask(__name__, template_folder=os.path.expanduser("~/pi-thermo/templates"))
+    # Imported here so sensor/relay-only use of this module doesn't pay for Flask
+    from flask import Flask, Response, render_template, jsonify, request
+    
+    app = Flask(__name__, template_folder=TEMPLATE_FOLDER)
+    app.config["TEMPLATES_AUTO_RELOAD"] = False
+    
+    # index.html has no template variables, so render it once and serve the
+    # bytes (no per-request stat/open/read of the template on the SD card)
+    page_cache = {"index": None}
+    
+    # Compact, unsorted JSON from jsonify() when orjson isn't installed
+    app.json.compact = True
+    app.json.sort_keys = False
+    
+    # Optional: gzip larger responses (e.g. /api/events) if flask-compress is installed
+    try:
+        from flask_compress import Compress
+    except ImportError:
+        Compress = None
+    if Compress is not None:
+        app.config["COMPRESS_MIN_SIZE"] = 512
+        Compress(app)
+    
+    def fast_jsonify(payload):
+        """jsonify() equivalent that encodes with orjson when available"""
+        if orjson is not None:
+            return Response(orjson.dumps(payload), mimetype="application/json")
+        return jsonify(payload)
     
     @app.route('/')
     def index():
         """Serve web interface"""
-        return render_template('index.html')
+        if page_cache["index"] is None:
+            page_cache["index"] = render_template('index.html').encode()
+        return Response(page_cache["index"], mimetype="text/html")
     
     @app.route('/api/status', methods=['GET'])
     def api_status():
         """Get current thermostat status"""
         if controller:
-            return jsonify(controller.get_status())
-        return jsonify({"error": "Controller not initialized"}), 500
+            # Serve the pre-encoded body; unchanged state answers 304 via ETag
+            body, etag = controller.get_status_bytes()
+            response = Response(body, mimetype="application/json")
+            response.set_etag(etag)
+            return response.make_conditional(request)
+        return fast_jsonify({"error": "Controller not initialized"}), 500
     
     @app.route('/api/setpoint', methods=['POST'])
     def api_setpoint():
         """Set target temperature"""
-        logger.info(f"[SETPOINT API] Received POST request")
         data = request.get_json()
-        logger.info(f"[SETPOINT API] Request data: {data}")
         
         if 'temperature' not in data:
             logger.error("[SETPOINT API] Missing temperature parameter")
-            return jsonify({"error": "Missing temperature parameter"}), 400
+            return fast_jsonify({"error": "Missing temperature parameter"}), 400
         
         try:
             temp = float(data['temperature'])
-            logger.info(f"[SETPOINT API] Parsed temperature: {temp}°F")
             
             if 50 <= temp <= 90:  # Reasonable range
-                logger.info(f"[SETPOINT API] Temperature in valid range, calling set_target_temp({temp})")
                 result = controller.set_target_temp(temp)
-                logger.info(f"[SETPOINT API] set_target_temp returned: {result}")
                 
                 if result:
-                    logger.info(f"[SETPOINT API] SUCCESS - Set target to {temp}°F")
-                    return jsonify({"status": "ok", "target_temp_f": temp})
+                    logger.info("[SETPOINT API] data=%s result=%s", data, result)
+                    return fast_jsonify({"status": "ok", "target_temp_f": temp})
                 else:
                     logger.error(f"[SETPOINT API] FAILED - set_target_temp returned False for {temp}°F")
-                    return jsonify({"error": "Failed to save temperature setting"}), 500
+                    return fast_jsonify({"error": "Failed to save temperature setting"}), 500
             else:
                 logger.error(f"[SETPOINT API] Temperature {temp}°F out of range (50-90)")
-                return jsonify({"error": "Temperature out of range (50-90°F)"}), 400
+                return fast_jsonify({"error": "Temperature out of range (50-90°F)"}), 400
         except ValueError as e:
             logger.error(f"[SETPOINT API] Invalid temperature value: {data.get('temperature')} - {e}")
-            return jsonify({"error": f"Invalid temperature value: {e}"}), 400
+            return fast_jsonify({"error": f"Invalid temperature value: {e}"}), 400
         except Exception as e:
             logger.error(f"[SETPOINT API] Unexpected error: {e}", exc_info=True)
-            return jsonify({"error": f"Server error: {e}"}), 500
+            return fast_jsonify({"error": f"Server error: {e}"}), 500
     
     @app.route('/api/events', methods=['GET'])
     def api_events():
         """Get heating on/off event log"""
         limit = request.args.get('limit', 100, type=int)
+        since = request.args.get('since')
         if controller:
-            events = controller.event_logger.get_events(limit)
-            return jsonify({"events": events})
-        return jsonify({"error": "Controller not initialized"}), 500
+            if since:
+                events = controller.event_logger.get_events_since(since, limit)
+            else:
+                events = controller.event_logger.get_events(limit)
+            return fast_jsonify({"events": events})
+        return fast_jsonify({"error": "Controller not initialized"}), 500
     
     @app.route('/api/outside-temp', methods=['GET'])
     def api_outside_temp():
         """Get current outside temperature"""
         if controller:
-            return jsonify({
-                "outside_temp_f": round(controller.outside_temp, 1) if controller.outside_temp else None,
+            return fast_jsonify({
+                "outside_temp_f": controller.outside_temp_rounded,
                 "last_check": controller.last_outside_temp_check,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": controller.timestamp_iso
             })
-        return jsonify({"error": "Controller not initialized"}), 500
+        return fast_jsonify({"error": "Controller not initialized"}), 500
     
     @app.route('/api/energy-saving', methods=['GET', 'POST'])
     def api_energy_saving():
         """Get or set energy saving mode status"""
         if not controller:
-            return jsonify({"error": "Controller not initialized"}), 500
+            return fast_jsonify({"error": "Controller not initialized"}), 500
         
         if request.method == 'GET':
-            return jsonify({
+            return fast_jsonify({
                 "energy_saving_active": controller.energy_saving_active,
                 "energy_saving_override": controller.energy_saving_override,
                 "override_start_time": controller.override_start_time,
-                "outside_temp_f": round(controller.outside_temp, 1) if controller.outside_temp else None,
-                "inside_temp_f": round(controller.current_temp_f, 1) if controller.current_temp_f else None,
-                "timestamp": datetime.now().isoformat()
+                "outside_temp_f": controller.outside_temp_rounded,
+                "inside_temp_f": controller.current_temp_f_rounded,
+                "timestamp": controller.timestamp_iso
             })
         elif request.method == 'POST':
             data = request.get_json() or {}
@@ -1080,28 +1838,94 @@ def create_app():
             # Handle override request
             if data.get('override', False):
                 controller.set_energy_saving_override()
-                return jsonify({
+                return fast_jsonify({
                     "status": "ok",
                     "message": "Energy saving override activated",
                     "override_duration_hours": controller.config.get("energy_saving_override_duration", 3600) / 3600
                 })
             else:
-                return jsonify({"error": "Only override action supported"}), 400
+                return fast_jsonify({"error": "Only override action supported"}), 400
     
     @app.route('/api/thermal-data', methods=['GET'])
     def api_thermal_data():
         """Get thermal analysis data"""
         if controller and controller.thermal_analysis:
             thermal_data = controller.thermal_analysis.get_thermal_data()
-            return jsonify({
+            return fast_jsonify({
                 "thermal_data": thermal_data,
                 "energy_saving_active": controller.energy_saving_active,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": controller.timestamp_iso
             })
-        return jsonify({"error": "Controller not initialized"}), 500
+        return fast_jsonify({"error": "Controller not initialized"}), 500
     
     return app
 
+def make_fallback_server(app, host, port, max_threads=WEB_SERVER_THREADS):
+    """Werkzeug server with a bounded pool of daemon request threads.
+
+    Used when waitress isn't installed. Stock threaded=True spawns a thread
+    per request with no limit; here the accept loop blocks once max_threads
+    requests are in flight, so bursts queue in the listen backlog instead.
+    """
+    from socketserver import ThreadingMixIn
+    from werkzeug.serving import BaseWSGIServer
+
+    class BoundedWSGIServer(ThreadingMixIn, BaseWSGIServer):
+        multithread = True
+        daemon_threads = True
+        allow_reuse_address = True  # SO_REUSEADDR, set before bind
+        request_queue_size = WEB_LISTEN_BACKLOG
+
+        def __init__(self, *args, **kwargs):
+            self._slots = threading.BoundedSemaphore(max_threads)
+            super().__init__(*args, **kwargs)
+
+        def process_request(self, request, client_address):
+            self._slots.acquire()
+            try:
+                super().process_request(request, client_address)
+            except Exception:
+                self._slots.release()
+                raise
+
+        def process_request_thread(self, request, client_address):
+            try:
+                super().process_request_thread(request, client_address)
+            finally:
+                self._slots.release()
+
+    return BoundedWSGIServer(host, port, app)
+
+def serve_web(app):
+    """Run the web server until the process exits"""
+    logger.info(f"Starting web server on {WEB_HOST}:{WEB_PORT} (Pi Zero 2W optimized)")
+    try:
+        # Prefer waitress (small worker pool); fall back to threaded werkzeug
+        try:
+            from waitress import serve
+        except ImportError:
+            serve = None
+        
+        if serve:
+            logger.info(f"Web server initialized on {WEB_HOST}:{WEB_PORT} (waitress, {WEB_SERVER_THREADS} threads)")
+            serve(
+                app,
+                host=WEB_HOST,
+                port=WEB_PORT,
+                threads=WEB_SERVER_THREADS,
+                connection_limit=WEB_CONNECTION_LIMIT,
+                backlog=WEB_LISTEN_BACKLOG,
+                channel_timeout=WEB_CHANNEL_TIMEOUT,
+                max_request_body_size=WEB_MAX_REQUEST_BODY,
+                asyncore_use_poll=True  # poll() has no FD_SETSIZE ceiling
+            )
+        else:
+            server = make_fallback_server(app, WEB_HOST, WEB_PORT)
+            logger.info(f"Web server initialized on {WEB_HOST}:{WEB_PORT} (werkzeug, {WEB_SERVER_THREADS} threads)")
+            server.serve_forever()
+    except Exception as e:
+        logger.error(f"Web server error: {e}")
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
@@ -1121,31 +1945,15 @@ def main():
         signal.signal(signal.SIGINT, controller.signal_handler)
         signal.signal(signal.SIGTERM, controller.signal_handler)
         
-        # Start controller thread
-        control_thread = threading.Thread(target=controller.run, daemon=False)
-        control_thread.start()
-        
-        # Start web server
+        # Build the web app before starting control so a missing Flask fails fast
         app = create_app()
-        logger.info(f"Starting web server on {WEB_HOST}:{WEB_PORT} (Pi Zero 2W optimized)")
-        try:
-            # Lightweight config for Pi Zero 2W
-            from werkzeug.serving import make_server
-            server = make_server(
-                WEB_HOST, 
-                WEB_PORT, 
-                app, 
-                threaded=False,  # Reduced threading for Pi Zero 2W
-                processes=1     # Single process for Pi Zero 2W
-            )
-            server.socket.setsockopt(1, 15, 1)  # SO_REUSEADDR
-            logger.info(f"Web server initialized on {WEB_HOST}:{WEB_PORT} (lightweight mode)")
-            server.serve_forever()
-        except Exception as e:
-            logger.error(f"Web server error: {e}")
         
-        # Wait for control thread
-        control_thread.join()
+        # Web server on a daemon thread; the control loop runs on the main
+        # thread, so when a signal stops it the process exits with it
+        web_thread = threading.Thread(target=serve_web, args=(app,), daemon=True)
+        web_thread.start()
+        
+        controller.run()
     
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)